@@ -0,0 +1,24 @@
+import threading
+
+# ==== AUDIO CUES ===========================================
+# Tone sequences as (Hz, ms) pairs
+CUE_SCRAM = ((2000, 100), (1500, 100), (1000, 100))
+CUE_TIMER_START = ((1000, 500),)
+CUE_TIMER_DONE = ((880, 200), (1760, 300))
+
+
+def play_tones(tones):
+    """Play a tone sequence; winsound.Beep blocks, so this runs on a worker thread"""
+    try:
+        import winsound
+        for freq, duration_ms in tones:
+            winsound.Beep(freq, duration_ms)
+    except Exception as e:
+        print(f"Audio alert error: {e}")
+
+
+def cue(tones):
+    """Play an audio cue without blocking the Tk event loop"""
+    threading.Thread(target=play_tones, args=(tones,), daemon=True).start()
+
+# ==== END AUDIO CUES =======================================
@@ -0,0 +1,83 @@
+import time
+
+
+# Interval between countdown label refreshes scheduled with after(); the label
+# shows whole seconds, so four ticks a second keep it on time
+COUNTDOWN_TICK_MS = 250
+
+
+class CountdownController:
+    """Handles countdown timer functionality"""
+    
+    def __init__(self, parent):
+        self.parent = parent
+        self.countdown_running = False
+        self.countdown_end_ns = None  # time.monotonic_ns() deadline
+        self._after_id = None  # Pending after() job for the next tick
+        self._last_time_str = None  # Last text written to the label
+        self._last_total_s = None  # Displayed whole seconds that text was formatted from
+        
+    def start_countdown(self, duration_s):
+        """Start countdown timer for given duration in seconds (Tk thread; workers use SABREGUI.start_timer)"""
+        if self.parent.countdown_label is None:
+            print("Timer label not initialized yet")
+            return
+            
+        self.countdown_end_ns = time.monotonic_ns() + int(duration_s * 1_000_000_000)
+        self.countdown_running = True
+        self._cancel_tick()
+        self._last_total_s = None
+        self._tick()
+        print(f"Countdown started for {duration_s} seconds")
+
+    def _cancel_tick(self):
+        """Cancel the pending tick, if any"""
+        if self._after_id is not None:
+            self.parent.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        """Refresh the label and reschedule on the Tk loop while the countdown runs"""
+        self._after_id = None
+        self.update_countdown()
+        if self.countdown_running:
+            self._after_id = self.parent.after(COUNTDOWN_TICK_MS, self._tick)
+
+    def update_countdown(self):
+        """Refresh the countdown label from the monotonic deadline"""
+        if not self.countdown_running:
+            return
+            
+        remaining_ns = max(0, self.countdown_end_ns - time.monotonic_ns()) if self.countdown_end_ns else 0
+        
+        if remaining_ns > 0:
+            # Round up so the label reads 00:01 until the countdown actually ends
+            total_s = -(-remaining_ns // 1_000_000_000)
+            
+            # Skip formatting and the Tcl call while the displayed second has not moved
+            if total_s == self._last_total_s:
+                return
+            self._last_total_s = total_s
+            
+            minutes, seconds = divmod(total_s, 60)
+            self._set_label(f"{minutes:02d}:{seconds:02d}")
+        else:
+            self._set_label("00:00")
+            self.countdown_running = False
+            print("Countdown completed")
+
+    def stop_countdown(self):
+        """Stop the countdown timer"""
+        self.countdown_running = False
+        self._cancel_tick()
+        self._last_total_s = None
+        self._set_label("00:00")
+        print("Countdown stopped")
+
+    def _set_label(self, time_str):
+        """Write time_str to the countdown label unless it is already showing"""
+        if time_str == self._last_time_str:
+            return
+        if self.parent.countdown_label is not None:
+            self.parent.countdown_label.config(text=time_str)
+        self._last_time_str = time_str 
\ No newline at end of file
@@ -0,0 +1,198 @@
+import hashlib
+import os
+import json
+import logging
+import tkinter as tk
+from tkinter import filedialog
+
+# Use orjson for JSON decoding when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+log = logging.getLogger(__name__)
+
+# Import from the utility functions - using try/except for graceful handling
+try:
+    from Nested_Programs.Utility_Functions import composite_waveform_duration
+except ImportError:
+    # Fallback if utility functions aren't available
+    def composite_waveform_duration(*args, **kwargs):
+        return 0.0  # No waveform, no duration
+
+try:
+    from Nested_Programs.Constants_Paths import CACHE_DIR
+except ImportError:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+
+class MethodManager:
+    """Handles polarization method selection and management"""
+    def __init__(self, parent):
+        self.parent = parent
+        self.polarization_method_file = None
+        self.polarization_methods_dir = r"C:\Users\walsworthlab\Desktop\SABRE Program\config_files_SABRE\PolarizationMethods"
+        self.selected_method_var = tk.StringVar(value="Select method...")
+        self.polarization_method_var = tk.StringVar(value="Select method...")
+        self.method_combobox = None  # Optional extra method combobox kept in sync by refresh_method_list
+        # Last options tuple handed out; reused while the listing is unchanged
+        self._method_options = ("Select method...",)
+        # Methods directory st_mtime_ns that _method_options was listed at
+        self._methods_mtime = None
+        # Content hash -> duration (s), persisted outside the methods directory
+        self._duration_cache = None
+        self._duration_cache_file = os.path.join(CACHE_DIR, "method_durations.json")
+        
+    def load_polarization_methods_from_directory(self):
+        """Load all JSON polarization method files from the specified directory"""
+        try:
+            try:
+                mtime = os.stat(self.polarization_methods_dir).st_mtime_ns
+            except FileNotFoundError:
+                # Create directory if it doesn't exist
+                os.makedirs(self.polarization_methods_dir)
+                return ("Select method...",)
+            
+            # Adding, removing or renaming a file bumps the directory mtime
+            if mtime == self._methods_mtime:
+                return self._method_options
+            
+            # Get all JSON files in the directory, sorted alphabetically, in one pass
+            with os.scandir(self.polarization_methods_dir) as it:
+                json_files = sorted(e.name for e in it if e.name.endswith('.json') and e.is_file())
+            methods = ("Select method...", *json_files)
+            self._methods_mtime = mtime
+            
+            # Share one tuple between all comboboxes; callers can compare by identity
+            if methods == self._method_options:
+                return self._method_options
+            self._method_options = methods
+            
+            print(f"Found {len(json_files)} polarization method files in {self.polarization_methods_dir}")
+            return methods
+            
+        except Exception as e:
+            print(f"Error loading polarization methods from directory: {e}")
+            return ("Select method...",)
+            
+    def on_method_selected(self, event=None):
+        """Handle method selection from combobox"""
+        try:
+            selected_method = self.selected_method_var.get()
+            if selected_method and selected_method != "Select method...":
+                self.polarization_method_file = os.path.join(self.polarization_methods_dir, selected_method)
+                print(f"Selected polarization method: {self.polarization_method_file}")
+                
+                # Update the live waveform plot in the main tab
+                self.parent._refresh_live_waveform()
+                
+                # Grey out bubbling time parameter when method is selected
+                self._update_bubbling_time_state(disabled=True)
+            else:
+                # Re-enable bubbling time parameter when no method is selected
+                self._update_bubbling_time_state(disabled=False)
+        except Exception as e:
+            log.debug("Error handling method selection: %s", e)
+            
+    def _update_bubbling_time_state(self, disabled=True):
+        """Update the state (enabled/disabled) of bubbling time entries"""
+        try:
+            state = "disabled" if disabled else "normal"
+            
+            # Update Main tab bubbling time entry
+            if hasattr(self.parent, 'entries') and "Bubbling Time" in self.parent.entries:
+                entry = self.parent.entries["Bubbling Time"]
+                if hasattr(entry, 'config'):
+                    entry.config(state=state)
+                    if disabled:
+                        entry.config(bg="#f0f0f0")  # Grey background when disabled
+                    else:
+                        entry.config(bg=self.parent.theme_manager.color("entry_bg"))
+            
+            # Update Advanced tab bubbling time entry  
+            if (hasattr(self.parent, 'parameter_section') and 
+                self.parent.parameter_section and 
+                hasattr(self.parent.parameter_section, 'entries') and 
+                "Bubbling Time" in self.parent.parameter_section.entries):
+                
+                entry = self.parent.parameter_section.entries["Bubbling Time"]
+                if hasattr(entry, 'config'):
+                    entry.config(state=state)
+                    if disabled:
+                        entry.config(bg="#f0f0f0")  # Grey background when disabled
+                    else:
+                        entry.config(bg=self.parent.theme_manager.color("entry_bg"))
+            
+            action = "disabled" if disabled else "enabled"
+            print(f"Bubbling time parameter {action} - polarization method timing will be used")
+            
+        except Exception as e:
+            print(f"Error updating bubbling time state: {e}")
+            
+    def select_polarization_method(self):
+        """Open file dialog to select polarization method"""
+        file_path = filedialog.askopenfilename(
+            initialdir=self.polarization_methods_dir,
+            title="Select Polarization Method",
+            filetypes=[("JSON files", "*.json")]
+        )
+        if file_path:
+            self.polarization_method_file = file_path
+            filename = os.path.basename(file_path)
+            self.selected_method_var.set(filename)
+            print(f"Selected polarization method: {file_path}")
+            
+            # Update the live waveform plot in the main tab
+            self.parent._refresh_live_waveform()
+            
+    def compute_polarization_duration(self):
+        """Return the duration (s) of the waveform described by the currently selected polarization-method JSON file"""
+        if not self.parent.polarization_method_file:
+            return 0.0
+        try:
+            with open(self.parent.polarization_method_file, 'rb') as f:
+                raw = f.read()
+
+            # Identical file contents always give the same duration
+            key = hashlib.blake2b(raw, digest_size=8).hexdigest()
+            durations = self._load_duration_cache()
+            if key in durations:
+                return durations[key]
+
+            cfg = _loads(raw)
+
+            # Size the buffer the DAQ routine will output from the segment metadata alone
+            if isinstance(cfg, dict) and cfg.get("type") == "SLIC_sequence":
+                duration = composite_waveform_duration(cfg)
+            else:
+                duration = composite_waveform_duration(cfg["ramp_sequences"])
+
+            durations[key] = duration
+            self._save_duration_cache()
+            return duration
+        except Exception as e:
+            print(f"[Timer] duration-calc error: {e}")
+            return 0.0
+
+    def _load_duration_cache(self):
+        """Return the persisted hash -> duration map, reading the cache file on first use"""
+        if self._duration_cache is None:
+            try:
+                with open(self._duration_cache_file, 'rb') as f:
+                    self._duration_cache = _loads(f.read())
+            except (OSError, ValueError):
+                self._duration_cache = {}
+        return self._duration_cache
+
+    def _save_duration_cache(self):
+        """Write the hash -> duration map to the cache file"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_file = self._duration_cache_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self._duration_cache, f)
+            os.replace(tmp_file, self._duration_cache_file)
+        except OSError as e:
+            print(f"Error saving duration cache: {e}")
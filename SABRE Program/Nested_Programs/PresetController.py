@@ -0,0 +1,151 @@
+import tkinter as tk
+from tkinter import messagebox
+import json
+import os
+
+# Use orjson for JSON decoding when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Import constants
+from Constants_Paths import PRESETS_DIR
+
+
+class PresetController:
+    """Handles all preset-related functionality"""
+    # Advanced preset parameter -> SABREGUI entry attribute
+    _ADVANCED_ENTRY_ATTRS = {
+        'Injection Time': 'injection_time_entry',
+        'Valve Control Timing': 'valve_time_entry',
+        'Degassing Time': 'degassing_time_entry',
+        'Transfer Time': 'transfer_time_entry',
+        'Recycle Time': 'recycle_time_entry',
+    }
+    
+    def __init__(self, parent):
+        self.parent = parent
+        self.current_preset_data = {}
+        # Parsed presets keyed by path -> (st_mtime_ns, data); re-read only when the file changes
+        self._preset_mem = {}
+        
+    def _load_preset(self, preset_file):
+        """Return the parsed preset, reusing the cached copy while the file is unchanged"""
+        mtime_ns = os.stat(preset_file).st_mtime_ns  # raises FileNotFoundError if missing
+        cached = self._preset_mem.get(preset_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with open(preset_file, 'rb') as f:
+            preset_data = _loads(f.read())
+        self._preset_mem[preset_file] = (mtime_ns, preset_data)
+        return preset_data
+        
+    def on_preset_selected_auto_fill(self, event=None):
+        """Auto-fill all parameters when a preset is selected"""
+        try:
+            selected_preset = self.parent.selected_preset_var.get()
+            if not selected_preset or selected_preset == "Select a method preset...":
+                return
+                
+            # Load preset data from file - the name came from a directory scan, so
+            # open it directly and only handle the rare case where it has since vanished
+            preset_file = os.path.join(PRESETS_DIR, f"{selected_preset}.json")
+            try:
+                preset_data = self._load_preset(preset_file)
+            except FileNotFoundError:
+                messagebox.showerror("Error", f"Preset file not found: {selected_preset}")
+                return
+                
+            # Store the preset data
+            self.current_preset_data = preset_data
+            
+            # Auto-fill parameters in both Main and Advanced tabs
+            self._auto_fill_parameters(preset_data)
+            
+            print(f"Loaded and applied preset: {selected_preset}")
+        except Exception as e:
+            print(f"Error loading preset: {e}")
+            messagebox.showerror("Error", f"Failed to load preset: {e}")
+            
+    @staticmethod
+    def _set_entry(entry, value):
+        """Write value into an Entry-like widget unless it already shows exactly that text"""
+        if not (hasattr(entry, 'delete') and hasattr(entry, 'insert')):
+            return
+        value = str(value)
+        # Re-applying a preset mostly rewrites identical text; one get() is cheaper
+        # than a delete/insert pair and leaves the cursor and redraws alone
+        if hasattr(entry, 'get') and entry.get() == value:
+            return
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
+        
+    @staticmethod
+    def _set_var(var, value):
+        """Set a Tk variable only when its value changes, so no-op writes fire no traces"""
+        if var.get() != value:
+            var.set(value)
+        
+    def _auto_fill_parameters(self, preset_data):
+        """Auto-fill parameters in both Main and Advanced tabs based on preset data"""
+        try:
+            # Fill Main tab parameters (if they exist)
+            if hasattr(self.parent, 'entries') and self.parent.entries:
+                for param_name, param_data in preset_data.get('general', {}).items():
+                    if param_name in self.parent.entries:
+                        # Extract just the value, not the full dict
+                        value = param_data.get('value', param_data) if isinstance(param_data, dict) else param_data
+                        self._set_entry(self.parent.entries[param_name], value)
+                        
+                        # Set unit if available and units dict exists
+                        if hasattr(self.parent, 'units') and param_name in self.parent.units and isinstance(param_data, dict) and 'unit' in param_data:
+                            self._set_var(self.parent.units[param_name], param_data['unit'])
+            
+            # Fill Advanced tab parameters via parameter section
+            if hasattr(self.parent, 'parameter_section') and self.parent.parameter_section:
+                # Fill general parameters
+                for param_name, param_data in preset_data.get('general', {}).items():
+                    if hasattr(self.parent.parameter_section, 'entries') and param_name in self.parent.parameter_section.entries:
+                        self._set_entry(self.parent.parameter_section.entries[param_name],
+                                        param_data.get('value', param_data))
+                        
+                        # Set unit if available
+                        if hasattr(self.parent.parameter_section, 'units') and param_name in self.parent.parameter_section.units and 'unit' in param_data:
+                            self._set_var(self.parent.parameter_section.units[param_name], param_data['unit'])
+                
+                # Fill advanced parameters
+                for param_name, param_data in preset_data.get('advanced', {}).items():
+                    entry_attr = self._ADVANCED_ENTRY_ATTRS.get(param_name)
+                    if entry_attr is not None:
+                        if hasattr(self.parent, entry_attr):
+                            self._set_entry(getattr(self.parent, entry_attr),
+                                            param_data.get('value', param_data))
+            # Update polarization method if specified
+            if 'polarization_method' in preset_data:
+                method_file = preset_data['polarization_method']
+                if method_file:
+                    # Extract just the filename from the path
+                    method_name = os.path.basename(method_file)
+                    
+                    # Update both the file path and dropdown selection
+                    self.parent.polarization_method_file = method_file
+                      # Update dropdown to show the selected method
+                    if hasattr(self.parent, 'polarization_method_var'):
+                        self._set_var(self.parent.polarization_method_var, method_name)
+                    elif hasattr(self.parent, 'selected_method_var'):
+                        self._set_var(self.parent.selected_method_var, method_name)
+                    
+                    print(f"Set polarization method to: {method_name}")
+                    
+                    # Update the live waveform plot with the new method
+                    if hasattr(self.parent, 'waveform_controller'):
+                        self.parent.waveform_controller.refresh_live_waveform()
+            
+            print(f"Successfully auto-filled parameters from preset")
+                
+        except Exception as e:
+            print(f"Error auto-filling parameters: {e}")
+            messagebox.showwarning("Auto-Fill Warning", 
+                                 f"Some parameters could not be auto-filled: {e}") 
\ No newline at end of file
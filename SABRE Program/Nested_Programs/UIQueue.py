@@ -0,0 +1,56 @@
+import queue
+
+# Period (ms) of the drain loop while a worker thread may post calls
+UI_QUEUE_TICK_MS = 33
+
+
+class UIQueueMixin:
+    """Hand calls from worker threads to the Tk thread through a queue
+
+    Worker threads never touch Tk: they post_to_ui(func, *args) and the Tk thread
+    runs the calls. A GUI with its own periodic tick calls run_posted_calls() from it;
+    otherwise begin_ui_posts()/end_ui_posts() bracket each posting thread and the
+    drain loop only runs while one is registered or calls are still queued.
+    """
+
+    def init_ui_queue(self):
+        """Create the call queue (call from __init__, on the Tk thread)"""
+        self._ui_calls = queue.SimpleQueue()
+        self._ui_posters = 0  # Posting threads registered with begin_ui_posts
+        self._ui_drain_id = None  # Pending after() job of the drain loop
+
+    def post_to_ui(self, func, *args):
+        """Queue func(*args) to run on the Tk thread; safe from any thread"""
+        self._ui_calls.put((func, args))
+
+    def run_posted_calls(self):
+        """Run every queued call (Tk thread only)"""
+        while not self._ui_calls.empty():
+            func, args = self._ui_calls.get_nowait()
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error in queued UI call: {e}")
+
+    def begin_ui_posts(self):
+        """Register a thread that will post calls and start the drain loop (Tk thread only)"""
+        self._ui_posters += 1
+        if self._ui_drain_id is None:
+            self._ui_drain_id = self.after(UI_QUEUE_TICK_MS, self._drain_ui_calls)
+
+    def end_ui_posts(self):
+        """Unregister a posting thread; safe from any thread, queued behind its last call"""
+        self.post_to_ui(self._ui_posts_ended)
+
+    def _ui_posts_ended(self):
+        self._ui_posters -= 1
+
+    def _drain_ui_calls(self):
+        """Drain loop: run queued calls, keep going while any posting thread is registered"""
+        # Reschedule first - a queued dialog runs a nested event loop until dismissed
+        self._ui_drain_id = self.after(UI_QUEUE_TICK_MS, self._drain_ui_calls)
+        self.run_posted_calls()
+        # A nested event loop in a queued call may already have stopped the loop
+        if self._ui_posters <= 0 and self._ui_calls.empty() and self._ui_drain_id is not None:
+            self.after_cancel(self._ui_drain_id)
+            self._ui_drain_id = None
@@ -0,0 +1,74 @@
+import tkinter as tk
+from tkinter import messagebox
+import os
+
+# Panel classes are imported when a window is first opened so their
+# matplotlib/nidaqmx dependencies are not loaded at startup
+
+
+class WindowManager:
+    """Manages detached windows and panel creation"""
+    
+    def __init__(self, parent):
+        self.parent = parent
+        self.detached_windows = {}
+        
+    def open_panel(self, panel_type):
+        """Open various test panels"""
+        try:
+            if panel_type == "ai":
+                from TestPanels_AI_AO import AnalogInputPanel
+                AnalogInputPanel(self.parent, embedded=False)
+            elif panel_type == "ao":
+                from TestPanels_AI_AO import AnalogOutputPanel
+                AnalogOutputPanel(self.parent, embedded=False)
+            elif panel_type == "slic":
+                from SLIC_Control import SLICSequenceControl
+                SLICSequenceControl(self.parent, embedded=False)
+            elif panel_type == "polarization":
+                from Polarization_Calc import PolarizationApp
+                PolarizationApp(self.parent, embedded=False)
+            elif panel_type == "full_flow":
+                self._open_full_flow_system()
+            elif panel_type == "virtual":
+                self._toggle_virtual_panel()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {panel_type} panel: {e}")
+    
+    def _open_full_flow_system(self):
+        """Open the Full Flow System window"""
+        if not hasattr(self.parent, 'full_flow_window') or self.parent.full_flow_window is None:
+            self.parent.full_flow_window = tk.Toplevel(self.parent)
+            self.parent.full_flow_window.title("Full Flow System")
+            self.parent.full_flow_window.geometry("800x600")
+            
+            # Create the FullFlowSystem instance in the new window
+            from FullFlowSystem import FullFlowSystem
+            full_flow_app = FullFlowSystem(self.parent.full_flow_window)
+            full_flow_app.pack(fill="both", expand=True)
+            
+            # Handle window close event
+            def on_closing():
+                self.parent.full_flow_window.destroy()
+                self.parent.full_flow_window = None
+            
+            self.parent.full_flow_window.protocol("WM_DELETE_WINDOW", on_closing)
+        else:
+            # Bring existing window to front
+            self.parent.full_flow_window.lift()
+            self.parent.full_flow_window.focus_force()
+    
+    def _toggle_virtual_panel(self):
+        """Toggle the Virtual Testing Environment window, building it only once"""
+        panel = self.parent.virtual_panel
+        if panel is None or not panel.winfo_exists() or not panel.toplevel.winfo_exists():
+            from Virtual_Testing_Panel import VirtualTestingPanel
+            panel = VirtualTestingPanel(self.parent, embedded=False)
+            # Closing the window hides it so the next toggle can reuse it
+            panel.toplevel.protocol("WM_DELETE_WINDOW", panel.toplevel.withdraw)
+            self.parent.virtual_panel = panel
+        elif panel.toplevel.winfo_viewable():
+            panel.toplevel.withdraw()
+        else:
+            panel.toplevel.deiconify()
+            panel.toplevel.lift()
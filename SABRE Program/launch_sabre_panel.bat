@@ -0,0 +1,3 @@
+@echo off
+cd /d "C:\Users\walsworthlab\Desktop\SABRE Panel Program"
+pyw SABREPanelProgram.py
\ No newline at end of file